@@ -1,28 +1,67 @@
-﻿import os
+﻿import hashlib
+import os
 import re
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+import numpy as np
 import pandas as pd
 import streamlit as st
+import xlsxwriter
 from fpdf import FPDF
+from PIL import Image
+
+
+# Compiled once and shared by the price-file and filename code paths
+_DIGITS_RE = re.compile(r"(\d+)")
+_NON_DIGITS_RE = re.compile(r"[^0-9]")
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+_THOUSANDS_RE = re.compile(r"\d{1,3}(?:,\d{3})+(?:\.\d+)?")
+_DECIMAL_COMMA_RE = re.compile(r"\d+,\d+")
 
 
 # ---------- Helpers to detect columns in the price file ----------
 
+# Exact normalized header names (see normalize_col); sets give O(1) lookups
+CODE_HEADERS = frozenset({"CODE", "ITEMCODE", "STOCKCODE", "PLUCODE"})
+DESC_HEADERS = frozenset({"DESC", "DESCR", "ITEMDESC", "STOCKDESC"})
+
+
 def normalize_col(name: str) -> str:
     """Normalize a column header for matching: uppercase, remove non-alphanumerics."""
-    return re.sub(r"[^A-Z0-9]+", "", str(name).upper())
+    return _NON_ALNUM_RE.sub("", str(name).upper())
+
+
+def parse_prices(text: pd.Series) -> pd.Series:
+    """
+    Parse price text to float64, NaN where it isn't a plain number.
+    Commas count as thousands separators only in the 1,234,567.89 shape;
+    a lone decimal comma ("12,50") is read as a decimal point. Anything
+    else ("R 45.00", "POA") is NaN rather than guessed at.
+
+    >>> parse_prices(pd.Series(["1,234.50", "12,50", "1,234", "R 45.00", "POA", ""])).tolist()
+    [1234.5, 12.5, 1234.0, nan, nan, nan]
+    """
+    text = text.fillna("").astype(str).str.strip()
+    thousands = text.str.fullmatch(_THOUSANDS_RE)
+    decimal_comma = text.str.fullmatch(_DECIMAL_COMMA_RE)
+    text = text.where(~thousands, text.str.replace(",", "", regex=False))
+    text = text.where(~decimal_comma, text.str.replace(",", ".", regex=False))
+    return pd.to_numeric(text, errors="coerce").astype("float64")
 
 
 def load_price_file(uploaded_file) -> pd.DataFrame:
     """
     Load the price Excel and return a clean DataFrame with columns:
-      CODE, DESCRIPTION, PRICE_A_INCL, CODE_KEY
+      CODE, DESCRIPTION, PRICE_A_INCL, PRICE_TEXT, CODE_KEY
     CODE_KEY is a normalized numeric string used for matching filenames.
+    PRICE_A_INCL is float from parse_prices: NaN where the cell is blank or
+    its text isn't a plain number (e.g. "R 45.00", "POA").
+    PRICE_TEXT is the cell's stripped text, so those prices are still shown.
     """
-    # Read everything as string so we don't lose leading zeros
-    df = pd.read_excel(uploaded_file, dtype=str)
+    # Read everything as string so we don't lose leading zeros.
+    # calamine (Rust) parses both .xlsx and legacy .xls far faster than openpyxl.
+    df = pd.read_excel(uploaded_file, dtype=str, engine="calamine")
 
     # Find likely CODE, DESCRIPTION, PRICE columns
     code_col = None
@@ -33,22 +72,22 @@ def load_price_file(uploaded_file) -> pd.DataFrame:
         norm = normalize_col(col)
 
         # CODE
-        if code_col is None and norm in ("CODE", "ITEMCODE", "STOCKCODE", "PLUCODE"):
+        if code_col is None and norm in CODE_HEADERS:
             code_col = col
 
         # DESCRIPTION
-        if desc_col is None and (
-            "DESCRIPTION" in norm
-            or norm in ("DESC", "DESCR", "ITEMDESC", "STOCKDESC")
-        ):
+        if desc_col is None and (norm in DESC_HEADERS or "DESCRIPTION" in norm):
             desc_col = col
 
         # PRICE (PRICE-A INCL etc.)
-        if price_col is None:
-            if "PRICEAINCL" in norm or "PRICEAINCL" in norm:
-                price_col = col
-            elif norm.startswith("PRICEA") and "INCL" in norm:
-                price_col = col
+        if price_col is None and (
+            "PRICEAINCL" in norm or (norm.startswith("PRICEA") and "INCL" in norm)
+        ):
+            price_col = col
+
+        # Wide sheets: stop as soon as all three are found
+        if code_col is not None and desc_col is not None and price_col is not None:
+            break
 
     if code_col is None:
         raise ValueError("Could not find CODE column in the price file.")
@@ -64,14 +103,17 @@ def load_price_file(uploaded_file) -> pd.DataFrame:
     df["CODE"] = df["CODE"].astype(str).str.strip()
     df = df[df["CODE"].notna() & (df["CODE"] != "")]
 
-    # Normalize price as string
-    df["PRICE_A_INCL"] = df["PRICE_A_INCL"].astype(str).str.strip()
+    # Price as a real float column, converted once here so Excel gets
+    # native numbers and matching needs no fix-up; the original text is kept
+    # alongside for prices that don't parse
+    df["PRICE_TEXT"] = df["PRICE_A_INCL"].fillna("").astype(str).str.strip()
+    df["PRICE_A_INCL"] = parse_prices(df["PRICE_TEXT"])
 
     # CODE_KEY: only digits from CODE, used to match filename digits
     df["CODE_KEY"] = (
         df["CODE"]
         .astype(str)
-        .str.replace(r"[^0-9]", "", regex=True)
+        .str.replace(_NON_DIGITS_RE, "", regex=True)
         .str.lstrip("0")  # remove leading zeros for safer matching
     )
 
@@ -84,62 +126,125 @@ def load_price_file(uploaded_file) -> pd.DataFrame:
     return df
 
 
-# ---------- Match photos to price rows ----------
-
-def extract_code_from_filename(filename: str) -> str | None:
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_price_file_cached(file_bytes: bytes) -> pd.DataFrame:
     """
-    Extract digits from filename like '8613900001-25PCS.JPG' -> '8613900001'.
-    Returns normalized numeric string without leading zeros.
+    Cached load_price_file keyed on the upload's bytes, so reruns with the
+    same price Excel skip the (slow) parse entirely.
     """
-    m = re.search(r"(\d+)", filename)
-    if not m:
-        return None
-    digits = m.group(1)
-    return digits.lstrip("0") or digits  # avoid empty if all zeros
+    with BytesIO(file_bytes) as buf:
+        return load_price_file(buf)
+
 
+# ---------- Match photos to price rows ----------
 
-def match_photos_to_prices(photo_files, price_df: pd.DataFrame) -> pd.DataFrame:
+def match_photos_to_prices(photo_names, price_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Given a list of uploaded photo files and a cleaned price_df,
+    Given a list of photo filenames and a cleaned price_df,
     return a DataFrame with columns:
 
-      PHOTO_FILE, CODE, DESCRIPTION, PRICE_A_INCL
+      PHOTO_FILE, CODE, DESCRIPTION, PRICE_A_INCL, PRICE_TEXT
     """
-    # Build a lookup dict from CODE_KEY
-    price_dict = (
-        price_df.set_index("CODE_KEY")[["CODE", "DESCRIPTION", "PRICE_A_INCL"]]
-        .to_dict("index")
+    photo_df = pd.DataFrame({"PHOTO_FILE": pd.array(list(photo_names), dtype="string")})
+
+    # Code rule, in one regex scan over all names: the first digit run,
+    # leading zeros stripped ('8613900001-25PCS.JPG' -> '8613900001');
+    # an all-zero run is kept as-is rather than becoming empty
+    digits = photo_df["PHOTO_FILE"].str.extract(_DIGITS_RE, expand=False).fillna("")
+    stripped = digits.str.lstrip("0")
+    photo_df["CODE_KEY"] = stripped.where(stripped != "", digits).astype(str)
+
+    # One hash join resolves every photo; CODE_KEY is unique in price_df,
+    # so a left merge keeps exactly one row per photo, in upload order.
+    merged = photo_df.merge(
+        price_df[["CODE_KEY", "CODE", "DESCRIPTION", "PRICE_A_INCL", "PRICE_TEXT"]],
+        on="CODE_KEY",
+        how="left",
     )
 
-    rows = []
+    # Strings as pandas' string dtype; price is already float64 from
+    # load_price_file (the merge leaves NaN for unmatched photos)
+    return pd.DataFrame(
+        {
+            "PHOTO_FILE": merged["PHOTO_FILE"],
+            "CODE": merged["CODE"].astype("string").fillna(""),
+            "DESCRIPTION": merged["DESCRIPTION"].astype("string").fillna(""),
+            "PRICE_A_INCL": merged["PRICE_A_INCL"].astype("float64"),
+            "PRICE_TEXT": merged["PRICE_TEXT"].astype("string").fillna(""),
+        }
+    )
 
-    for f in photo_files:
-        fname = f.name
-        key = extract_code_from_filename(fname)
-        code_val = ""
-        desc_val = ""
-        price_val = ""
-
-        if key:
-            info = price_dict.get(key)
-            if info is None:
-                # Try without stripping zeros (just in case)
-                info = price_dict.get(key.zfill(len(key)))
-            if info is not None:
-                code_val = info.get("CODE", "")
-                desc_val = info.get("DESCRIPTION", "")
-                price_val = info.get("PRICE_A_INCL", "")
-
-        rows.append(
-            {
-                "PHOTO_FILE": fname,
-                "CODE": code_val,
-                "DESCRIPTION": desc_val,
-                "PRICE_A_INCL": price_val,
-            }
+
+# ---------- Photo thumbnails ----------
+
+# 60 mm at ~200 dpi: sharp in print, a fraction of a camera JPEG's size
+THUMB_PX = 480
+
+
+def make_thumbnail(data: bytes, max_px: int = THUMB_PX) -> bytes:
+    """
+    Downscale a photo so its longest side is at most max_px.
+    Returns JPEG bytes (PNG if the source has transparency).
+
+    draft() lets libjpeg decode straight at 1/2, 1/4 or 1/8 scale from the
+    DCT coefficients, so large camera JPEGs are never decoded at full size.
+    It is a no-op for PNG.
+    """
+    # Closing the image releases the decoder's full-size buffer immediately,
+    # instead of whenever the garbage collector gets to it
+    with BytesIO(data) as src, Image.open(src) as img:
+        is_jpeg = img.format == "JPEG"
+        if is_jpeg and max(img.size) <= max_px:
+            # Already small enough: FPDF embeds JPEG bytes as-is, so skip the
+            # decode + re-encode entirely
+            return data
+        img.draft("RGB", (max_px * 2, max_px * 2))
+        # Box-reduce by an integer factor first, then one cheap bilinear pass
+        img.thumbnail(
+            (max_px, max_px), resample=Image.Resampling.BILINEAR, reducing_gap=2.0
+        )
+
+        # PNG only where transparency must survive; JPEG encodes photographic
+        # content several times faster and smaller
+        has_alpha = img.mode in ("RGBA", "LA") or (
+            img.mode == "P" and "transparency" in img.info
         )
+        # Carry the colour profile across so wide-gamut (e.g. Display P3)
+        # photos don't print with shifted colours
+        icc_profile = img.info.get("icc_profile")
+        with BytesIO() as out:
+            if has_alpha:
+                img.save(out, format="PNG", icc_profile=icc_profile)
+            else:
+                img.convert("RGB").save(
+                    out, format="JPEG", quality=85, icc_profile=icc_profile
+                )
+            thumb = out.getvalue()
+
+    # A JPEG only a little over max_px can re-encode bigger than the source;
+    # then the original is both smaller and lossless, so keep it
+    if is_jpeg and len(thumb) >= len(data):
+        return data
+    return thumb
+
+
+def build_thumbnails(photos: dict[str, bytes], max_px: int = THUMB_PX) -> dict[str, bytes]:
+    """
+    Thumbnail every photo, keyed by filename. Pillow releases the GIL while
+    decoding and resampling, so a thread pool overlaps the work across cores.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        thumbs = pool.map(lambda data: make_thumbnail(data, max_px), photos.values())
+        return dict(zip(photos, thumbs))
 
-    return pd.DataFrame(rows)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_thumbnails_cached(photos: dict[str, bytes]) -> dict[str, bytes]:
+    """
+    Cached build_thumbnails keyed on the photo bytes, so a new price file
+    (or anything else that changes the matched rows) reuses the thumbnails.
+    """
+    return build_thumbnails(photos)
 
 
 # ---------- PDF generation (60 x 60 images, text underneath) ----------
@@ -150,7 +255,13 @@ class CataloguePDF(FPDF):
         self.set_auto_page_break(auto=True, margin=10)
 
 
-def build_pdf(df: pd.DataFrame, photo_files, temp_dir: str) -> bytes:
+def _join_lines(first: pd.Series, second: pd.Series) -> pd.Series:
+    """Vectorised "\\n".join of two string columns, skipping empty parts only."""
+    both = (first != "") & (second != "")
+    return (first + "\n" + second).where(both, first + second)
+
+
+def build_pdf(df: pd.DataFrame, thumbs: dict[str, bytes]) -> bytes:
     """
     Build a PDF with each product:
       - Photo (60 x 60 mm)
@@ -158,6 +269,7 @@ def build_pdf(df: pd.DataFrame, photo_files, temp_dir: str) -> bytes:
       - Description
       - Price
     All text is *under* the photo.
+    thumbs maps PHOTO_FILE -> image bytes (see build_thumbnails).
     """
     pdf = CataloguePDF()
     pdf.add_page()
@@ -165,9 +277,6 @@ def build_pdf(df: pd.DataFrame, photo_files, temp_dir: str) -> bytes:
     pdf.cell(0, 10, "Photo Catalogue", ln=1, align="C")
     pdf.ln(2)
 
-    # Map filename -> UploadedFile
-    photo_map = {f.name: f for f in photo_files}
-
     # Layout: 2 columns per row
     page_w = 210
     margin_x = 10
@@ -178,63 +287,58 @@ def build_pdf(df: pd.DataFrame, photo_files, temp_dir: str) -> bytes:
     img_size = 60  # <- 60 x 60 as requested
     text_height = 18  # rough height for 3 text lines
     row_height = img_size + text_height + 6
+    rows_per_page = int((297 - 10 - margin_top) // row_height)  # A4 height 297mm
 
-    x_positions = [margin_x, margin_x + col_w]
-    y = margin_top
-    col_index = 0
+    # Precompute every cell's page and x/y position in one vectorised pass
+    idx = np.arange(len(df))
+    grid_row = idx // 2
+    pages = grid_row // rows_per_page
+    xs = margin_x + (idx % 2) * col_w
+    ys = margin_top + (grid_row % rows_per_page) * row_height
 
     pdf.set_font("Arial", size=9)
 
-    for _, row in df.iterrows():
-        # New page if we don't have enough space
-        if y + row_height > (297 - 10):  # A4 height 297mm
+    # Build every text block (Code / Description / Price, empty parts
+    # skipped) in one vectorised pass so the row loop only reads strings
+    codes = df["CODE"].astype(str)
+    descs = df["DESCRIPTION"].astype(str)
+    prices = df["PRICE_A_INCL"]
+    price_texts = df["PRICE_TEXT"].astype(str)
+    code_lines = ("Code: " + codes).where(codes != "", "")
+    # Parsed prices are formatted; unparsed ones ("POA") print as written
+    price_lines = ("Price: " + prices.map("{:,.2f}".format).astype(str)).where(
+        prices.notna(), ("Price: " + price_texts).where(price_texts != "", "")
+    )
+    df = df.assign(LABEL=_join_lines(_join_lines(code_lines, descs), price_lines))
+
+    # itertuples yields light namedtuples instead of a boxed Series per row
+    current_page = 0
+    for x, y, page, row in zip(
+        xs.tolist(), ys.tolist(), pages.tolist(), df.itertuples(index=False)
+    ):
+        # New page once the current one is full
+        if page != current_page:
             pdf.add_page()
             pdf.set_font("Arial", "B", 14)
             pdf.cell(0, 10, "Photo Catalogue", ln=1, align="C")
             pdf.ln(2)
             pdf.set_font("Arial", size=9)
-            y = margin_top
-            col_index = 0
-
-        x = x_positions[col_index]
+            current_page = page
 
         # Draw image if available
-        fname = row["PHOTO_FILE"]
-        uploaded = photo_map.get(fname)
-        if uploaded is not None:
-            # Save to temp file and embed
-            img_path = os.path.join(temp_dir, fname)
-            with open(img_path, "wb") as img_out:
-                img_out.write(uploaded.getvalue())
-            pdf.image(img_path, x=x + (col_w - img_size) / 2, y=y, w=img_size, h=img_size)
+        fname = row.PHOTO_FILE
+        thumb = thumbs.get(fname)
+        if thumb is not None:
+            # Embed the downscaled copy straight from memory
+            pdf.image(BytesIO(thumb), x=x + (col_w - img_size) / 2, y=y, w=img_size, h=img_size)
 
         # Text underneath
         text_x = x
         text_y = y + img_size + 2
         pdf.set_xy(text_x, text_y)
 
-        code = str(row.get("CODE", "") or "")
-        desc = str(row.get("DESCRIPTION", "") or "")
-        price = str(row.get("PRICE_A_INCL", "") or "")
-
-        # Build a small block of text; multi_cell keeps it in the column
-        lines = []
-        if code:
-            lines.append(f"Code: {code}")
-        if desc:
-            lines.append(desc)
-        if price:
-            lines.append(f"Price: {price}")
-        text = "\n".join(lines) if lines else ""
-
-        pdf.multi_cell(col_w, 4, text)
-
-        # Move to next column / row
-        if col_index == 0:
-            col_index = 1
-        else:
-            col_index = 0
-            y += row_height
+        # multi_cell keeps the text block in the column
+        pdf.multi_cell(col_w, 4, row.LABEL)
 
     # fpdf2 dest="S" returns a bytearray; normalise to bytes
     result = pdf.output(dest="S")
@@ -254,23 +358,54 @@ def build_excel(df: pd.DataFrame) -> bytes:
 
     Photo contains the filename of the image (so you can still see which is which).
     """
+    # Parsed prices go in as numbers, unparsed ones ("POA") as their text;
+    # missing prices become None so XlsxWriter leaves the cell blank
+    prices = df["PRICE_A_INCL"]
+    price_texts = df["PRICE_TEXT"].astype(object)
     export_df = pd.DataFrame(
         {
             "Photo": df["PHOTO_FILE"],
             "Code": df["CODE"],
             "Description": df["DESCRIPTION"],
-            "Price": df["PRICE_A_INCL"],
+            "Price": prices.astype(object).where(
+                prices.notna(), price_texts.where(price_texts != "", None)
+            ),
         }
     )
 
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        export_df.to_excel(writer, index=False, sheet_name="Catalogue")
-    return output.getvalue()
+    with BytesIO() as output:
+        # constant_memory flushes each row to disk as soon as the next one
+        # starts, so memory stays flat however many rows we write (rows must
+        # go in order)
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        worksheet = workbook.add_worksheet("Catalogue")
+        header_fmt = workbook.add_format({"bold": True, "border": 1, "align": "center"})
+
+        worksheet.write_row(0, 0, list(export_df.columns), header_fmt)
+        for r, values in enumerate(export_df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(r, 0, values)
+
+        workbook.close()
+        return output.getvalue()
 
 
 # ---------- Streamlit app ----------
 
+def catalogue_key(price_bytes: bytes, photos: dict[str, bytes]) -> tuple:
+    """
+    Content fingerprint of the current uploads, used to skip regenerating
+    the catalogue when nothing changed. blake2b is much faster than sha256
+    for hashing large photo bytes.
+    """
+    def digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+    return (
+        digest(price_bytes),
+        tuple((name, digest(data)) for name, data in photos.items()),
+    )
+
+
 def main():
     st.set_page_config(page_title="Photo Catalogue Builder", layout="wide")
     st.title("Photo Catalogue Builder")
@@ -297,22 +432,46 @@ def main():
         key="photo_files",
     )
 
-    if st.button("Generate catalogue"):
+    generate = st.button("Generate catalogue")
+    if generate:
         if not price_file:
             st.error("Please upload a price Excel file.")
             return
         if not photo_files:
             st.error("Please upload at least one product photo.")
             return
+    if not price_file or not photo_files:
+        return
+
+    # Read each upload once; bytes are also the cache key for the builders
+    price_bytes = price_file.getvalue()
+    # Photos are keyed by filename; say so rather than silently dropping
+    # uploads that share a name (e.g. the same file picked from two folders)
+    photos = {}
+    duplicates = set()
+    for f in photo_files:
+        if f.name in photos:
+            duplicates.add(f.name)
+        else:
+            photos[f.name] = f.getvalue()
+    if duplicates:
+        st.warning(
+            "Some photos share a filename; only the first of each was used: "
+            + ", ".join(sorted(duplicates))
+        )
+    key = catalogue_key(price_bytes, photos)
 
+    # Only rebuild when the inputs actually changed; results live in
+    # session_state so they survive reruns (e.g. clicking a download button)
+    if generate and st.session_state.get("catalogue_key") != key:
         try:
-            price_df = load_price_file(price_file)
+            price_df = load_price_file_cached(price_bytes)
         except Exception as e:
             st.error(f"Error reading price file: {e}")
             return
 
         try:
-            df_matched = match_photos_to_prices(photo_files, price_df)
+            df_matched = match_photos_to_prices(list(photos), price_df)
         except Exception as e:
             st.error(f"Error matching photos to prices: {e}")
             return
@@ -321,20 +480,14 @@ def main():
             st.warning("No matches found between photo filenames and price codes.")
             return
 
-        # Show a preview (no UploadedFile objects inside the DataFrame)
-        st.subheader("Preview of matched data")
-        st.dataframe(
-            df_matched[["PHOTO_FILE", "CODE", "DESCRIPTION", "PRICE_A_INCL"]],
-            use_container_width=True,
-        )
-
         # Build files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            try:
-                pdf_bytes = build_pdf(df_matched, photo_files, tmpdir)
-            except Exception as e:
-                st.error(f"Error building PDF: {e}")
-                return
+        try:
+            # Decode + resize each unique photo once; reused across reruns
+            thumbs = build_thumbnails_cached(photos)
+            pdf_bytes = build_pdf(df_matched, thumbs)
+        except Exception as e:
+            st.error(f"Error building PDF: {e}")
+            return
 
         try:
             excel_bytes = build_excel(df_matched)
@@ -342,21 +495,36 @@ def main():
             st.error(f"Error building Excel: {e}")
             return
 
-        st.subheader("Download files")
+        st.session_state["catalogue"] = (df_matched, pdf_bytes, excel_bytes)
+        st.session_state["catalogue_key"] = key
 
-        st.download_button(
-            "Download PDF catalogue",
-            data=pdf_bytes,
-            file_name="photo_catalogue.pdf",
-            mime="application/pdf",
-        )
+    if st.session_state.get("catalogue_key") != key:
+        return  # nothing generated yet for the current uploads
 
-        st.download_button(
-            "Download Excel file",
-            data=excel_bytes,
-            file_name="catalogue.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
+    df_matched, pdf_bytes, excel_bytes = st.session_state["catalogue"]
+
+    # Show a preview (no UploadedFile objects inside the DataFrame)
+    st.subheader("Preview of matched data")
+    st.dataframe(
+        df_matched[["PHOTO_FILE", "CODE", "DESCRIPTION", "PRICE_A_INCL", "PRICE_TEXT"]],
+        use_container_width=True,
+    )
+
+    st.subheader("Download files")
+
+    st.download_button(
+        "Download PDF catalogue",
+        data=pdf_bytes,
+        file_name="photo_catalogue.pdf",
+        mime="application/pdf",
+    )
+
+    st.download_button(
+        "Download Excel file",
+        data=excel_bytes,
+        file_name="catalogue.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
 
 
 if __name__ == "__main__":